@@ -1,10 +1,28 @@
 """Implementation of the higher-order DMD (HODMD).
 """
 
+from typing import List, Tuple
+
 import torch as pt
+from flowtorch.data.dataloader import Dataloader
 from .svd import SVD
 from .dmd import DMD
 
+# numba is an optional dependency; if available, the delay embedding
+# is filled by a compiled kernel that copies the blocks in parallel
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _fill_hankel(out, data, delay):
+        rows, cols = data.shape
+        for i in prange(delay):
+            out[i * rows:(i + 1) * rows, :] = data[:, i:cols - (delay - i - 1)]
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 
 def _check_time_delays(delay: int, columns: int, min_cols: int):
     """Check if the number of time delays is valid.
@@ -34,6 +52,13 @@ def _check_time_delays(delay: int, columns: int, min_cols: int):
 def _create_time_delays(data_matrix: pt.Tensor, delay: int,
                         min_cols: int = 2) -> pt.Tensor:
     """Create data matrix enriched with time delays (Hankel matrix).
+
+    The delay-embedded matrix is a block Hankel matrix, so every entry
+    already exists in the input matrix. The vertically stacked,
+    time-shifted blocks are expressed as a strided (zero-copy) view of
+    the input; a single reshape then materializes the 2D output in one
+    fused copy instead of one copy per delay block.
+
     :param data_matrix: 2D data matrix with (reduced) snapshots as column
         vectors
     :type data_matrix: pt.Tensor
@@ -46,11 +71,114 @@ def _create_time_delays(data_matrix: pt.Tensor, delay: int,
     :return: data matrix enriched with time delays
     :rtype: pt.Tensor
     """
-    _, cols = data_matrix.shape
+    rows, cols = data_matrix.shape
     _check_time_delays(delay, cols, min_cols)
-    return pt.cat(
-        [data_matrix[:, i:cols - (delay - i - 1)] for i in range(delay)]
+    # a single time level is equivalent to no embedding at all, so the
+    # input matrix can be passed through without any copy
+    if delay == 1:
+        return data_matrix
+    dm = data_matrix.contiguous()
+    if (_HAS_NUMBA and dm.device.type == "cpu"
+            and dm.dtype in (pt.float32, pt.float64)):
+        delayed = pt.empty((delay * rows, cols - delay + 1), dtype=dm.dtype)
+        _fill_hankel(delayed.numpy(), dm.numpy(), delay)
+        return delayed
+    blocks = dm.as_strided(
+        (delay, rows, cols - delay + 1),
+        (dm.stride(1), dm.stride(0), dm.stride(1))
     )
+    return blocks.reshape(delay * rows, cols - delay + 1)
+
+
+def _incremental_svd_update(U: pt.Tensor, s: pt.Tensor, batch: pt.Tensor,
+                            rank: int) -> Tuple[pt.Tensor, pt.Tensor]:
+    """Update a truncated SVD with a batch of new snapshot columns.
+
+    The update follows Brand's incremental SVD: the new columns are
+    split into their projection onto the current left singular vectors
+    and an orthogonal residual, a small core matrix combining both is
+    factorized, and the updated basis is truncated to the requested
+    rank. Only the left singular vectors and the singular values are
+    maintained, so the memory footprint stays at rows x rank plus the
+    batch, independent of the number of snapshots.
+
+    :param U: current left singular vectors; None on the first call
+    :type U: pt.Tensor
+    :param s: current singular values; None on the first call
+    :type s: pt.Tensor
+    :param batch: new snapshot columns
+    :type batch: pt.Tensor
+    :param rank: truncation rank
+    :type rank: int
+    :return: updated left singular vectors and singular values
+    :rtype: Tuple[pt.Tensor, pt.Tensor]
+    """
+    if U is None:
+        U, s, _ = pt.linalg.svd(batch, full_matrices=False)
+        return U[:, :rank], s[:rank]
+    projection = U.conj().T @ batch
+    Q, R = pt.linalg.qr(batch - U @ projection, mode="reduced")
+    r, b = s.shape[0], batch.shape[1]
+    core = pt.zeros((r + b, r + b), dtype=batch.dtype, device=batch.device)
+    core[:r, :r] = pt.diag(s)
+    core[:r, r:] = projection
+    core[r:, r:] = R
+    U_core, s_core, _ = pt.linalg.svd(core, full_matrices=False)
+    return pt.cat((U, Q), dim=1) @ U_core[:, :rank], s_core[:rank]
+
+
+@pt.jit.script
+def _back_project(U: pt.Tensor, reduced: pt.Tensor, r: int) -> pt.Tensor:
+    """Map the first r rows of a reduced-space result to the input space.
+
+    The function is TorchScript-compiled so the dtype cast, slicing,
+    and GEMM run as one compiled graph without Python dispatch.
+
+    :param U: POD basis of the dimensionality reduction
+    :type U: pt.Tensor
+    :param reduced: reduced-space matrix, e.g., DMD modes or errors
+    :type reduced: pt.Tensor
+    :param r: number of leading rows to back-project
+    :type r: int
+    :return: back-projected matrix in the input space
+    :rtype: pt.Tensor
+    """
+    return U.to(reduced.dtype) @ reduced[:r]
+
+
+def _reduced_precision_matmul(A: pt.Tensor, B: pt.Tensor,
+                              dtype: pt.dtype) -> pt.Tensor:
+    """Compute a matrix product with reduced-precision operands.
+
+    On hardware with matrix units, e.g., tensor cores, casting the
+    operands of a large GEMM to bfloat16 or float16 yields a large
+    throughput gain at visualization-grade accuracy. Reduced-precision
+    dtypes have no complex counterpart, so complex factors are split
+    into real and imaginary parts and multiplied in up to four real
+    matrix products.
+
+    :param A: real or complex left factor
+    :type A: pt.Tensor
+    :param B: real or complex right factor
+    :type B: pt.Tensor
+    :param dtype: reduced-precision dtype used for the multiplication
+    :type dtype: pt.dtype
+    :return: matrix product in the input precision of the right factor
+    :rtype: pt.Tensor
+    """
+    if A.is_complex():
+        real_part = _reduced_precision_matmul(A.real, B, dtype)
+        imag_part = _reduced_precision_matmul(A.imag, B, dtype)
+        if B.is_complex():
+            return pt.complex(real_part.real - imag_part.imag,
+                              real_part.imag + imag_part.real)
+        return pt.complex(real_part, imag_part)
+    A_low = A.to(dtype)
+    if B.is_complex():
+        real = (A_low @ B.real.to(dtype)).to(B.real.dtype)
+        imag = (A_low @ B.imag.to(dtype)).to(B.real.dtype)
+        return pt.complex(real, imag)
+    return (A_low @ B.to(dtype)).to(B.dtype)
 
 
 class HODMD(DMD):
@@ -77,7 +205,8 @@ class HODMD(DMD):
     """
 
     def __init__(self, data_matrix: pt.Tensor, dt: float, delay: int = None,
-                 rank_dr: int = None, **dmd_options: dict):
+                 rank_dr: int = None, mode_dtype: pt.dtype = None,
+                 **dmd_options: dict):
         """Create a HODMD instance from data matrix and time step.
 
         :param data_matrix: data matrix whose columns are formed by
@@ -93,20 +222,132 @@ class HODMD(DMD):
         :type delay: int, optional
         :param rank_dr: SVD rank of the initial dimensionality reduction step; if
             the default value is not overwritten, the rank is automatically determined as
-            described in :class:`flowtorch.analysis.svd.SVD`; defaults to None
+            described in :class:`flowtorch.analysis.svd.SVD`; if the rank is given
+            and small compared to the data matrix's dimensions, the reduction
+            is computed with a randomized truncated SVD; defaults to None
         :type rank_dr: int, optional
+        :param mode_dtype: reduced-precision dtype, e.g., *pt.bfloat16*,
+            used for the back-projection of the DMD modes to the input
+            space; the singular vectors and modes themselves keep their
+            precision, only the matrix product is computed in reduced
+            precision; if None, the projection runs in full precision;
+            defaults to None
+        :type mode_dtype: pt.dtype, optional
 
+        """
+        # only the first rank_dr left singular vectors are needed; for
+        # small ranks, the randomized factorization avoids the cost of
+        # a full SVD of the data matrix
+        randomized = (rank_dr is not None
+                      and rank_dr < 0.5 * min(data_matrix.shape))
+        svd_dr = SVD(data_matrix, rank_dr, randomized=randomized)
+        # the projection commutes with the time delay embedding, i.e.,
+        # projecting the delay-embedded matrix block-wise yields the
+        # same result as embedding the projected matrix; the latter
+        # requires only a single GEMM in the original space, and the
+        # embedding itself is a strided view of the GEMM's output
+        self._init_decomposition(data_matrix, svd_dr,
+                                 svd_dr.U.T @ data_matrix, dt, delay,
+                                 mode_dtype, **dmd_options)
+
+    def _init_decomposition(self, data_matrix: pt.Tensor, svd_dr: SVD,
+                            dm_red: pt.Tensor, dt: float, delay: int,
+                            mode_dtype: pt.dtype, **dmd_options: dict):
+        """Initialize the instance from a precomputed reduction.
+
+        Shared by the regular constructor and *from_loader*, which
+        computes the dimensionality reduction incrementally.
+
+        :param data_matrix: original data matrix; None if the snapshots
+            were streamed and the full matrix is not available
+        :type data_matrix: pt.Tensor
+        :param svd_dr: SVD of the initial dimensionality reduction
+        :type svd_dr: SVD
+        :param dm_red: data matrix projected onto the reduced basis
+        :type dm_red: pt.Tensor
+        :param dt: time step between two snapshots
+        :type dt: float
+        :param delay: number of time levels (delay coordinates) to use;
+            defaults to one third of the number of snapshots if None
+        :type delay: int
+        :param mode_dtype: reduced-precision dtype for the mode
+            back-projection; see the constructor
+        :type mode_dtype: pt.dtype
         """
         self._dm_org = data_matrix
-        self._rows_org, self._cols_org = data_matrix.shape
+        self._rows_org = svd_dr.U.shape[0]
+        self._cols_org = dm_red.shape[1]
+        self._mode_dtype = mode_dtype
         self._delay = delay
         if delay is None:
             self._delay = int(self._cols_org / 3)
-        self._svd_dr = SVD(data_matrix, rank_dr)
+        self._svd_dr = svd_dr
+        self._dm_red = dm_red
         super(HODMD, self).__init__(
-            _create_time_delays(self._svd_dr.U.T @ self._dm_org, self._delay),
+            _create_time_delays(self._dm_red, self._delay),
             dt, **dmd_options
         )
+        # the instance is immutable after construction, so the results
+        # of the expensive back-projections to the input space are
+        # computed once and reused on repeated property access
+        self._modes_org = None
+        self._projection_error_org = None
+        self._tlsq_error_org = None
+
+    @classmethod
+    def from_loader(cls, loader: Dataloader, field_name: str, times: List[str],
+                    dt: float, rank_dr: int, delay: int = None,
+                    batch_size: int = 64, **dmd_options: dict) -> "HODMD":
+        """Create a HODMD instance by streaming snapshots from a loader.
+
+        For long snapshot series, the full data matrix may not fit in
+        memory. This constructor reads the snapshots in batches and
+        maintains an incrementally updated truncated SVD for the
+        dimensionality reduction, so only the reduced basis, the
+        projected data matrix, and one batch of snapshots are held in
+        memory at any time. A second pass over the data computes the
+        projection onto the final basis. Properties requiring the
+        original data matrix, namely *reconstruction_error*, are not
+        available on instances created this way.
+
+        :param loader: dataloader providing the snapshots
+        :type loader: Dataloader
+        :param field_name: name of the field to load
+        :type field_name: str
+        :param times: write times of the snapshots to load
+        :type times: List[str]
+        :param dt: time step between two snapshots
+        :type dt: float
+        :param rank_dr: rank of the incremental dimensionality reduction
+        :type rank_dr: int
+        :param delay: number of time levels (delay coordinates) to use;
+            defaults to one third of the number of snapshots if None
+        :type delay: int, optional
+        :param batch_size: number of snapshots read per batch
+        :type batch_size: int, optional
+        :return: HODMD instance operating on the streamed data
+        :rtype: HODMD
+        """
+        U, s = None, None
+        for start in range(0, len(times), batch_size):
+            batch = loader.load_snapshot(
+                field_name, times[start:start + batch_size])
+            if batch.dim() > 2:
+                batch = batch.flatten(0, -2)
+            U, s = _incremental_svd_update(U, s, batch, rank_dr)
+        dm_red = pt.empty((U.shape[1], len(times)), dtype=U.dtype,
+                          device=U.device)
+        for start in range(0, len(times), batch_size):
+            batch = loader.load_snapshot(
+                field_name, times[start:start + batch_size])
+            if batch.dim() > 2:
+                batch = batch.flatten(0, -2)
+            dm_red[:, start:start + batch.shape[-1]] = U.conj().T @ batch
+        svd_dr = SVD.from_factors(U, s, cols=len(times))
+        dmd = cls.__new__(cls)
+        dmd._init_decomposition(None, svd_dr, dm_red, dt, delay, None,
+                                **dmd_options)
+        return dmd
 
     def predict(self, initial_condition: pt.Tensor, n_steps: int) -> pt.Tensor:
         """Predict evolution over N steps starting from used-defined initial conditions.
@@ -154,8 +395,16 @@ class HODMD(DMD):
         :return: DMD modes in the input space
         :rtype: pt.Tensor
         """
-        r = self.svd_dr.rank
-        return self.svd_dr.U.type(self._modes.dtype) @ super().modes[:r]
+        if self._modes_org is None:
+            r = self.svd_dr.rank
+            if self._mode_dtype is None:
+                self._modes_org = _back_project(
+                    self.svd_dr.U, super().modes, r)
+            else:
+                self._modes_org = _reduced_precision_matmul(
+                    self.svd_dr.U, super().modes[:r], self._mode_dtype
+                ).type(self._modes.dtype)
+        return self._modes_org
     
     @property
     def dynamics(self) -> pt.Tensor:
@@ -194,6 +443,12 @@ class HODMD(DMD):
         :return: reconstruction error
         :rtype: pt.Tensor
         """
+        if self._dm_org is None:
+            raise RuntimeError(
+                "The reconstruction error requires the original data"
+                " matrix, which is not kept for instances created with"
+                " from_loader"
+            )
         return self.reconstruction - self._dm_org
 
     @property
@@ -203,8 +458,11 @@ class HODMD(DMD):
         :return: projection error
         :rtype: pt.Tensor
         """
-        r = self.svd_dr.rank
-        return self.svd_dr.U @ super().projection_error[:r]
+        if self._projection_error_org is None:
+            r = self.svd_dr.rank
+            self._projection_error_org = _back_project(
+                self.svd_dr.U, super().projection_error, r)
+        return self._projection_error_org
 
     @property
     def tlsq_error(self) -> pt.Tensor:
@@ -213,6 +471,9 @@ class HODMD(DMD):
         :return: noise in X and Y
         :rtype: Tuple[pt.Tensor, pt.Tensor]
         """
-        dx, dy = super().tlsq_error
-        r = self.svd_dr.rank
-        return self.svd_dr.U @ dx[:r], self.svd_dr.U @ dy[:r]
+        if self._tlsq_error_org is None:
+            dx, dy = super().tlsq_error
+            r = self.svd_dr.rank
+            self._tlsq_error_org = (_back_project(self.svd_dr.U, dx, r),
+                                    _back_project(self.svd_dr.U, dy, r))
+        return self._tlsq_error_org
@@ -9,6 +9,14 @@ import torch as pt
 # flowtorch packages
 from flowtorch.data.utils import format_byte_size
 
+# cuSOLVER's SVD drivers are slower than LAPACK on the CPU for skinny
+# matrices; below this minimal dimension, the factorization of a CUDA
+# tensor runs on the CPU and the factors are moved back afterwards
+GPU_SVD_MIN_SIZE = 32
+# tall matrices are reduced to a square factor via QR before the SVD;
+# the aspect ratio above which the detour pays off
+QR_PREPROCESS_RATIO = 1.5
+
 
 def inexact_alm_matrix_complection(data_matrix: pt.Tensor, sparsity: float = 1.0,
                                    tol: float = 1.0e-6, max_iter: int = 100,
@@ -111,6 +119,20 @@ class SVD(object):
         if True or if dictionary with options for Inexact ALM algorithm; the SVD
         is computed only on the low rank matrix; defaults to False
     :type robust: Union[bool,dict]
+    :param compute_uv: compute the singular vectors in addition to the
+        singular values; if False, only the singular values are computed
+        via *torch.linalg.svdvals*, which is significantly faster, and
+        U and V are None; defaults to True
+    :type compute_uv: bool
+    :param driver: SVD driver to use for CUDA tensors, e.g., *gesvdj*
+        or *gesvda*; ignored for CPU tensors; defaults to None
+    :type driver: str
+    :param randomized: approximate the leading singular triplets with
+        randomized subspace iteration (*torch.svd_lowrank*); much faster
+        than the deterministic factorization if the rank is small
+        compared to the matrix dimensions; requires an explicit rank and
+        disables the SVHT rank estimate; defaults to False
+    :type randomized: bool
     :param rank: rank used for truncation
     :type rank: int
     :param opt_rank: optimal rank according to SVHT
@@ -147,7 +169,8 @@ class SVD(object):
     """
 
     def __init__(self, data_matrix: pt.Tensor, rank: int = None,
-                 robust: Union[bool, dict] = False):
+                 robust: Union[bool, dict] = False, compute_uv: bool = True,
+                 driver: str = None, randomized: bool = False):
         shape = data_matrix.shape
         assert len(shape) == 2, (
             f"The data matrix must be a 2D tensor.\
@@ -155,21 +178,142 @@ class SVD(object):
         )
         self._rows, self._cols = shape
         self._robust = robust
+        self._compute_uv = compute_uv
+        self._driver = driver
+        self._randomized = randomized and rank is not None
         if bool(self._robust):
             if isinstance(robust, dict):
                 L, S = inexact_alm_matrix_complection(data_matrix, **robust)
             else:
                 L, S = inexact_alm_matrix_complection(data_matrix)
             self._L, self._S = L, S
-            U, s, VH = pt.linalg.svd(L, full_matrices=False)
+            matrix = L
         else:
             self._L, self._S = None, None
-            U, s, VH = pt.linalg.svd(data_matrix, full_matrices=False)
-        self._opt_rank = self._optimal_rank(s)
-        self.rank = self.opt_rank if rank is None else rank
-        self._U = U[:, :self.rank]
+            matrix = data_matrix
+        if self._randomized:
+            U, s, VH = self._factorize_randomized(matrix, rank)
+            # the SVHT rank estimate requires the full spectrum, which
+            # the randomized factorization does not provide
+            self.rank = rank
+            self._opt_rank = self.rank
+        else:
+            U, s, VH = self._factorize(matrix)
+            self._opt_rank = self._optimal_rank(s)
+            self.rank = self.opt_rank if rank is None else rank
+        self._U = None if U is None else U[:, :self.rank]
         self._s = s[:self.rank]
-        self._V = VH.conj().T[:, :self.rank]
+        self._V = None if VH is None else VH.conj().T[:, :self.rank]
+
+    @classmethod
+    def from_factors(cls, U: pt.Tensor, s: pt.Tensor, V: pt.Tensor = None,
+                     cols: int = None) -> "SVD":
+        """Create an SVD instance from precomputed factors.
+
+        This constructor wraps factors obtained outside of the class,
+        e.g., from an incremental factorization of streamed data, so
+        they can be used wherever an SVD instance is expected. No
+        factorization is performed.
+
+        :param U: left singular vectors
+        :type U: pt.Tensor
+        :param s: singular values
+        :type s: pt.Tensor
+        :param V: right singular vectors; may be None if the factorization
+            did not track them; defaults to None
+        :type V: pt.Tensor, optional
+        :param cols: number of columns of the factorized data matrix;
+            only required if V is None; defaults to None
+        :type cols: int, optional
+        :return: SVD instance wrapping the given factors
+        :rtype: SVD
+        """
+        svd = cls.__new__(cls)
+        svd._rows = U.shape[0]
+        svd._cols = V.shape[0] if V is not None else cols
+        svd._robust = False
+        svd._compute_uv = True
+        svd._driver = None
+        svd._randomized = False
+        svd._L, svd._S = None, None
+        svd.rank = s.shape[0]
+        # the SVHT rank estimate requires the full spectrum, which
+        # truncated precomputed factors do not provide
+        svd._opt_rank = svd.rank
+        svd._U = U[:, :svd.rank]
+        svd._s = s[:svd.rank]
+        svd._V = None if V is None else V[:, :svd.rank]
+        return svd
+
+    def _factorize_randomized(self, matrix: pt.Tensor,
+                              rank: int) -> Tuple[pt.Tensor, pt.Tensor, pt.Tensor]:
+        """Compute a truncated SVD via randomized subspace iteration.
+
+        For small ranks, *torch.svd_lowrank* reduces the factorization
+        cost from O(mn min(m,n)) to O(mn rank). A small oversampling
+        margin on top of the requested rank improves the accuracy of
+        the leading singular triplets.
+
+        :param matrix: 2D matrix to decompose
+        :type matrix: pt.Tensor
+        :param rank: number of singular triplets to approximate
+        :type rank: int
+        :return: left singular vectors, singular values, and transposed
+            right singular vectors
+        :rtype: Tuple[pt.Tensor, pt.Tensor, pt.Tensor]
+        """
+        q = min(rank + 10, min(matrix.shape))
+        U, s, V = pt.svd_lowrank(matrix, q=q, niter=2)
+        if not self._compute_uv:
+            return None, s, None
+        return U, s, V.conj().transpose(-2, -1)
+
+    def _factorize(self, matrix: pt.Tensor) -> Tuple[pt.Tensor, pt.Tensor, pt.Tensor]:
+        """Compute the SVD with a device heuristic for skinny matrices.
+
+        CUDA tensors whose minimal dimension is below GPU_SVD_MIN_SIZE
+        are factorized on the CPU, since the GPU drivers are slower than
+        LAPACK in this regime; the factors are moved back to the input
+        device afterwards. The optional driver argument is forwarded to
+        *torch.linalg.svd* for CUDA tensors.
+
+        Tall matrices, typical for snapshot data with many more points
+        than snapshots, are first reduced to a square factor via an
+        economic QR decomposition; the SVD of the small square factor
+        has the same singular values and right singular vectors, and
+        the left singular vectors are recovered with one GEMM.
+
+        :param matrix: 2D matrix to decompose
+        :type matrix: pt.Tensor
+        :return: left singular vectors, singular values, and transposed
+            right singular vectors; the vectors are None if the instance
+            was created with compute_uv=False
+        :rtype: Tuple[pt.Tensor, pt.Tensor, pt.Tensor]
+        """
+        device = matrix.device
+        if matrix.is_cuda and min(matrix.shape) < GPU_SVD_MIN_SIZE:
+            matrix = matrix.cpu()
+        options = {}
+        if matrix.is_cuda and self._driver is not None:
+            options["driver"] = self._driver
+        rows, cols = matrix.shape
+        tall = rows >= int(QR_PREPROCESS_RATIO * cols)
+        if self._compute_uv:
+            if tall:
+                Q, R = pt.linalg.qr(matrix, mode="reduced")
+                U, s, VH = pt.linalg.svd(R, full_matrices=False, **options)
+                U = Q @ U
+            else:
+                U, s, VH = pt.linalg.svd(matrix, full_matrices=False,
+                                         **options)
+            return U.to(device), s.to(device), VH.to(device)
+        # if only singular values are needed, e.g., for error norms
+        # or rank estimates, svdvals skips the accumulation of the
+        # singular vectors, which dominates the factorization cost
+        if tall:
+            matrix = pt.linalg.qr(matrix, mode="r").R
+        s = pt.linalg.svdvals(matrix, **options)
+        return None, s.to(device), None
 
     def _optimal_rank(self, s: pt.Tensor) -> int:
         """Compute the optimal singular value hard threshold.
@@ -200,6 +344,11 @@ class SVD(object):
         :return: reconstruction of the input data matrix
         :rtype: pt.Tensor
         """
+        if not self._compute_uv:
+            raise RuntimeError(
+                "The reconstruction requires the singular vectors;"
+                " create the SVD instance with compute_uv=True"
+            )
         r_rank = self.rank if rank is None else max(min(rank, self.rank), 1)
         return self.U[:, :r_rank] @ pt.diag(self.s[:r_rank]) @ self.V[:, :r_rank].conj().T
 
@@ -259,9 +408,10 @@ class SVD(object):
         :return: cumulative size of truncated U, s, and V tensors in bytes
         :rtype: int
         """
-        return (self.U.element_size() * self.U.nelement() +
-                self.s.element_size() * self.s.nelement() +
-                self.V.element_size() * self.V.nelement())
+        return sum(
+            t.element_size() * t.nelement()
+            for t in (self.U, self.s, self.V) if t is not None
+        )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(data_matrix, rank={self.rank})"
@@ -270,7 +420,9 @@ class SVD(object):
         ms = []
         ms.append(f"SVD of a {self._rows}x{self._cols} data matrix")
         ms.append(f"Selected/optimal rank: {self.rank}/{self.opt_rank}")
-        ms.append(f"data type: {self.U.dtype} ({self.U.element_size()}b)")
+        dtype_source = self.s if self.U is None else self.U
+        ms.append(
+            f"data type: {dtype_source.dtype} ({dtype_source.element_size()}b)")
         size, unit = format_byte_size(self.required_memory)
         ms.append("truncated SVD size: {:1.4f}{:s}".format(size, unit))
         return "\n".join(ms)
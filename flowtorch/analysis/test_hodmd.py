@@ -6,6 +6,7 @@ import pytest
 import torch as pt
 # flowtorch packages
 from .hodmd import HODMD, _create_time_delays
+from .svd import SVD
 
 
 def test_create_time_delays():
@@ -67,6 +68,22 @@ class TestHODMD():
         modes = dmd.modes
         assert modes.shape == (50, dmd.svd.rank)
 
+    def test_modes_reduced_precision(self):
+        dm = pt.rand((50, 20))
+        dmd = HODMD(dm, 1.0, rank_dr=15, rank=10)
+        dmd_low = HODMD(dm, 1.0, rank_dr=15, rank=10, mode_dtype=pt.bfloat16)
+        assert dmd_low.modes.shape == dmd.modes.shape
+        assert dmd_low.modes.dtype == dmd.modes.dtype
+        assert pt.allclose(dmd_low.modes.abs(), dmd.modes.abs(), atol=1e-1)
+        # complex snapshot data yields a complex reduction basis, whose
+        # imaginary part must survive the reduced-precision projection
+        dm = pt.complex(pt.rand((50, 20)), pt.rand((50, 20)))
+        dmd = HODMD(dm, 1.0, rank_dr=15, rank=10)
+        dmd_low = HODMD(dm, 1.0, rank_dr=15, rank=10, mode_dtype=pt.bfloat16)
+        assert dmd_low.modes.shape == dmd.modes.shape
+        assert dmd_low.modes.dtype == dmd.modes.dtype
+        assert pt.allclose(dmd_low.modes.abs(), dmd.modes.abs(), atol=1e-1)
+
     def test_reconstruction_error(self):
         dm = pt.rand((50, 20))
         dmd = HODMD(dm, 1.0)
@@ -87,6 +104,28 @@ class TestHODMD():
         err = dmd.projection_error
         assert err.shape == (50, cols - 1)
 
+    def test_from_loader(self):
+        class InMemoryLoader:
+            def __init__(self, dm):
+                self._dm = dm
+
+            def load_snapshot(self, field_name, times):
+                return self._dm[:, [int(t) for t in times]]
+
+        pt.manual_seed(0)
+        dm = pt.rand((50, 5)) @ pt.rand((5, 20))
+        times = [str(i) for i in range(20)]
+        dmd = HODMD.from_loader(InMemoryLoader(dm), "p", times, 1.0,
+                                rank_dr=5, delay=5, batch_size=7)
+        assert dmd.delay == 5
+        assert dmd.svd_dr.rank == 5
+        assert dmd.modes.shape == (50, dmd.svd.rank)
+        # the incremental SVD recovers the spectrum of low rank data
+        assert pt.allclose(dmd.svd_dr.s, SVD(dm, 5).s, rtol=1e-3)
+        with pytest.raises(RuntimeError):
+            dmd.reconstruction_error
+        assert dmd.reconstruction.shape == (50, 20)
+
     def test_predict(self):
         dm = pt.rand((50, 20))
         dmd = HODMD(dm, 1.0, rank_dr=15, rank=10, delay=5)
@@ -67,6 +67,28 @@ class TestSVD():
         assert pt.linalg.norm(low-svd.L) < 20.0
 
 
+def test_singular_values_only():
+    X, _, _ = create_noisy_low_rank_data()
+    svd = SVD(X, 20, compute_uv=False)
+    assert svd.U is None
+    assert svd.V is None
+    assert pt.allclose(svd.s, SVD(X, 20).s)
+    assert svd.required_memory == svd.s.element_size() * svd.s.nelement()
+    with pytest.raises(RuntimeError):
+        svd.reconstruct()
+
+
+def test_randomized():
+    _, low, _ = create_noisy_low_rank_data()
+    svd = SVD(low, 2, randomized=True)
+    assert svd.U.shape == (low.shape[0], 2)
+    assert svd.V.shape == (low.shape[1], 2)
+    assert svd.rank == svd.opt_rank == 2
+    assert pt.allclose(svd.s, SVD(low, 2).s, rtol=1e-4)
+    # the randomized path requires an explicit rank
+    assert not SVD(low, randomized=True)._randomized
+
+
 def test_inexact_alm_matrix_completion():
     X, low, noise = create_noisy_low_rank_data()
     L, S = inexact_alm_matrix_complection(X)
@@ -1,12 +1,54 @@
 # standard library packages
+from os.path import join
 import pytest
 # third party packages
+import numpy as np
 import torch as pt
+from vtk import (vtkPoints, vtkUnstructuredGrid,
+                 vtkXMLUnstructuredGridReader, vtkXMLUnstructuredGridWriter)
+from vtk.util.numpy_support import numpy_to_vtk
 # flowtorch packages
 from flowtorch import DATASETS, FLOAT_TOLERANCE
 from flowtorch.data import VTKDataloader
 
 
+def write_test_snapshots(path: str, times: list):
+    for i, time in enumerate(times):
+        points = vtkPoints()
+        for j in range(4):
+            points.InsertNextPoint(float(j), 0.0, 0.0)
+        grid = vtkUnstructuredGrid()
+        grid.SetPoints(points)
+        data = numpy_to_vtk(np.full(4, float(i)), deep=True)
+        data.SetName("p")
+        grid.GetPointData().AddArray(data)
+        writer = vtkXMLUnstructuredGridWriter()
+        writer.SetFileName(join(path, f"flow_{time}.vtu"))
+        writer.SetInputData(grid)
+        writer.Write()
+
+
+def test_vtk_cache_parses_each_file_once(tmp_path):
+    times = [str(i) for i in range(10)]
+    write_test_snapshots(str(tmp_path), times)
+    loader = VTKDataloader(str(tmp_path), vtkXMLUnstructuredGridReader,
+                           "flow_", ".vtu", cache_size=4)
+    parsed = []
+    create_reader = loader._create_vtk_reader
+    loader._create_vtk_reader = lambda file_path: (
+        parsed.append(file_path), create_reader(file_path))[1]
+    snapshots = loader.load_snapshot("p", times)
+    assert snapshots.shape == (4, len(times))
+    for i in range(len(times)):
+        assert pt.allclose(snapshots[:, i], pt.full((4,), float(i)))
+    # more snapshots than cache slots, but each file is parsed only once
+    assert len(parsed) == len(times)
+    assert len(set(parsed)) == len(parsed)
+    # a repeated load of cached snapshots triggers no additional parsing
+    loader.load_snapshot("p", times[-4:])
+    assert len(parsed) == len(times)
+
+
 def test_vtk_flexi_field():
     path = DATASETS["vtk_cylinder_re200_flexi"]
     loader = VTKDataloader.from_flexi(path, "Cylinder_Re200_Solution_")
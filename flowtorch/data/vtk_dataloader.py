@@ -4,19 +4,33 @@
 """
 
 # standard library packages
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
-from os import sep
-from glob import glob
+from os import cpu_count, scandir
 from typing import Callable, Union, List, Dict
 # third party packages
+import numpy as np
 import torch as pt
-from vtk import vtkUnstructuredGridReader, vtkXMLUnstructuredGridReader
+from vtk import (vtkUnstructuredGridReader, vtkXMLUnstructuredGridReader,
+                 vtkXMLPUnstructuredGridReader)
 from vtk.numpy_interface.dataset_adapter import WrapDataObject, UnstructuredGrid
 # flowtorch packages
 from flowtorch import DEFAULT_DTYPE
 from .dataloader import Dataloader
 from .utils import check_and_standardize_path, check_list_or_str
 
+# enable VTK's threaded internal algorithms; the STDThread backend is
+# available in all standard VTK builds, while, e.g., TBB can be chosen
+# through VTK's own VTK_SMP_BACKEND_IN_USE environment variable
+try:
+    from os import environ
+    from vtk import vtkSMPTools
+    if environ.get("VTK_SMP_BACKEND_IN_USE") is None:
+        vtkSMPTools.SetBackend("STDThread")
+except ImportError:
+    pass
+
 
 class VTKDataloader(Dataloader):
     """Load unstructured VTK files and time series.
@@ -49,7 +63,8 @@ class VTKDataloader(Dataloader):
     """
 
     def __init__(self, path: str, vtk_reader: Union[vtkUnstructuredGridReader, vtkXMLUnstructuredGridReader],
-                 prefix: str = "", suffix: str = "", dtype: str = DEFAULT_DTYPE):
+                 prefix: str = "", suffix: str = "", dtype: str = DEFAULT_DTYPE,
+                 cache_size: int = 32, device: str = "cpu"):
         """Create a VTKDataloader instance from a folder of VTK files.
 
         The loader assumes that the write time is encoded in the file name.
@@ -64,12 +79,26 @@ class VTKDataloader(Dataloader):
         :type suffix: str, optional
         :param dtype: tensor type, defaults to DEFAULT_DTYPE
         :type dtype: str, optional
+        :param cache_size: number of parsed grids to keep in memory;
+            repeated requests for the same snapshot, e.g., when loading
+            several fields one after another, skip file parsing at the
+            expense of holding the cached grids in memory; defaults to 32
+        :type cache_size: int, optional
+        :param device: device on which loaded tensors are returned; for
+            a CUDA device, time series are staged in pinned host memory
+            and copied to the device asynchronously while the next
+            snapshot is parsed; defaults to "cpu"
+        :type device: str, optional
         """
         self._path = path
         self._vtk_reader = vtk_reader
         self._prefix = prefix
         self._suffix = suffix
         self._dtype = dtype
+        self._device = pt.device(device)
+        self._cache_size = cache_size
+        self._grid_cache = OrderedDict()
+        self._first_grid = None
         self._write_times = None
         self._field_names = None
 
@@ -78,7 +107,9 @@ class VTKDataloader(Dataloader):
         """Create loader instance from VTK files generated by Flexi_.
 
         Flexi supports the output of field and surface data as unstructured
-        XML-based VTK files.
+        XML-based VTK files. If the suffix indicates partitioned files
+        (*.pvtu*), the parallel XML reader is used, which reads the
+        pieces of each snapshot concurrently.
 
         .. _Flexi: https://www.flexi-project.org/
 
@@ -91,7 +122,9 @@ class VTKDataloader(Dataloader):
         :param dtype: tensor type, defaults to DEFAULT_DTYPE
         :type dtype: str, optional
         """
-        return cls(path, vtkXMLUnstructuredGridReader, prefix, suffix, dtype)
+        reader = (vtkXMLPUnstructuredGridReader if suffix.endswith(".pvtu")
+                  else vtkXMLUnstructuredGridReader)
+        return cls(path, reader, prefix, suffix, dtype)
 
     @classmethod
     def from_su2(cls, path: str, prefix: str = "", suffix: str = ".vtk", dtype: str = DEFAULT_DTYPE):
@@ -127,6 +160,148 @@ class VTKDataloader(Dataloader):
         reader.Update()
         return WrapDataObject(reader.GetOutput())
 
+    def _as_tensor(self, array) -> pt.Tensor:
+        """Convert a VTK data array to a tensor without redundant copies.
+
+        The tensor wraps the numpy buffer owned by the VTK grid instead
+        of copying it; a copy only happens if the array's dtype differs
+        from the loader's dtype. The returned tensor keeps the parsed
+        grid alive through the shared buffer.
+
+        :param array: VTK point data array
+        :return: tensor sharing memory with the VTK array if possible
+        :rtype: pt.Tensor
+        """
+        return pt.from_numpy(np.asarray(array)).to(self._dtype, copy=False)
+
+    def _to_device(self, tensor: pt.Tensor) -> pt.Tensor:
+        """Move a host tensor to the loader's device; no-op for CPU.
+
+        :param tensor: tensor to move
+        :type tensor: pt.Tensor
+        :return: tensor on the loader's device
+        :rtype: pt.Tensor
+        """
+        return tensor.to(self._device)
+
+    def _cache_grid(self, file_path: str, grid: UnstructuredGrid):
+        """Insert a parsed grid into the cache, evicting the oldest entry.
+
+        :param file_path: location of the VTK file
+        :type file_path: str
+        :param grid: parsed grid to cache
+        :type grid: UnstructuredGrid
+        """
+        self._grid_cache[file_path] = grid
+        self._grid_cache.move_to_end(file_path)
+        while len(self._grid_cache) > self._cache_size:
+            self._grid_cache.popitem(last=False)
+
+    def _load_grid(self, file_path: str) -> UnstructuredGrid:
+        """Get the parsed grid of a VTK file, reading it only if necessary.
+
+        :param file_path: location of the VTK file
+        :type file_path: str
+        :return: parsed grid, taken from the cache if available
+        :rtype: UnstructuredGrid
+        """
+        if file_path in self._grid_cache:
+            self._grid_cache.move_to_end(file_path)
+            return self._grid_cache[file_path]
+        grid = self._create_vtk_reader(file_path)
+        self._cache_grid(file_path, grid)
+        return grid
+
+    def _first_snapshot(self) -> UnstructuredGrid:
+        """Get the parsed grid of the first snapshot.
+
+        Metadata like field names and vertices are taken from the first
+        snapshot; the grid is parsed lazily on first access and pinned
+        on the instance so that it is never evicted from the grid cache
+        and never parsed twice.
+
+        :return: parsed grid of the first write time
+        :rtype: UnstructuredGrid
+        """
+        if self._first_grid is None:
+            self._first_grid = self._load_grid(
+                self._build_file_path(self.write_times[0])
+            )
+        return self._first_grid
+
+    def _read_snapshots(self, times: List[str]) -> List[UnstructuredGrid]:
+        """Read the VTK files of multiple snapshots in parallel.
+
+        The VTK readers release the GIL during file I/O and parsing,
+        so uncached snapshots are dispatched to a thread pool to overlap
+        reads across write times; snapshots already in the cache are
+        not read again.
+
+        :param times: snapshot write times
+        :type times: List[str]
+        :return: parsed grids in the order of the given write times
+        :rtype: List[UnstructuredGrid]
+        """
+        paths = [self._build_file_path(t) for t in times]
+        # the parsed grids are collected in a local mapping because the
+        # cache may hold fewer entries than the series has snapshots;
+        # relying on the cache alone would re-parse evicted grids
+        grids = {}
+        for path in paths:
+            if path in self._grid_cache:
+                self._grid_cache.move_to_end(path)
+                grids[path] = self._grid_cache[path]
+        missing = [p for p in dict.fromkeys(paths) if p not in grids]
+        if missing:
+            with ThreadPoolExecutor(
+                    max_workers=min(len(missing), cpu_count() or 1)) as ex:
+                for path, grid in zip(
+                        missing, ex.map(self._create_vtk_reader, missing)):
+                    grids[path] = grid
+                    self._cache_grid(path, grid)
+        return [grids[p] for p in paths]
+
+    def _stack_snapshots(self, grids: List[UnstructuredGrid],
+                         field_name: str) -> pt.Tensor:
+        """Assemble a time series of one field in a preallocated tensor.
+
+        Stacking a list of per-snapshot tensors would allocate every
+        intermediate tensor plus the stacked output; instead, the output
+        tensor is allocated once with its final shape and each snapshot
+        is copied directly into its time slice, halving peak memory.
+
+        If the loader's device is a CUDA device, the snapshots are
+        staged in pinned host memory and copied to the device on a
+        dedicated stream with non-blocking transfers, so the host-to-
+        device copy of one snapshot overlaps with the extraction of
+        the next one.
+
+        :param grids: parsed grids sorted by write time
+        :type grids: List[UnstructuredGrid]
+        :param field_name: name of the field to extract
+        :type field_name: str
+        :return: field values with the time series as last dimension
+        :rtype: pt.Tensor
+        """
+        shape = np.asarray(grids[0].PointData[field_name]).shape
+        if self._device.type == "cuda":
+            staging = pt.empty(shape + (len(grids),), dtype=self._dtype,
+                               pin_memory=True)
+            out = pt.empty(shape + (len(grids),), dtype=self._dtype,
+                           device=self._device)
+            stream = pt.cuda.Stream(self._device)
+            with pt.cuda.stream(stream):
+                for k, grid in enumerate(grids):
+                    staging[..., k] = self._as_tensor(
+                        grid.PointData[field_name])
+                    out[..., k].copy_(staging[..., k], non_blocking=True)
+            stream.synchronize()
+            return out
+        out = pt.empty(shape + (len(grids),), dtype=self._dtype)
+        for k, grid in enumerate(grids):
+            out[..., k] = self._as_tensor(grid.PointData[field_name])
+        return self._to_device(out)
+
     def _build_file_path(self, time: str) -> str:
         """Create file path VTK file.
 
@@ -145,67 +320,55 @@ class VTKDataloader(Dataloader):
         # load multiple fields
         if isinstance(field_name, list):
             if isinstance(time, list):
-                snapshots = [
-                    self._create_vtk_reader(self._build_file_path(t)).PointData for t in time
-                ]
+                grids = self._read_snapshots(time)
                 return [
-                    pt.stack(
-                        [pt.tensor(snapshot[name], dtype=self._dtype)
-                         for snapshot in snapshots], dim=-1
-                    ) for name in field_name
+                    self._stack_snapshots(grids, name) for name in field_name
                 ]
             else:
-                snapshot = self._create_vtk_reader(
-                    self._build_file_path(time)).PointData
+                snapshot = self._load_grid(self._build_file_path(time)).PointData
                 return [
-                    pt.tensor(snapshot[name], dtype=self._dtype) for name in field_name
+                    self._to_device(self._as_tensor(snapshot[name]))
+                    for name in field_name
                 ]
         # load single field
         else:
             if isinstance(time, list):
-                return pt.stack(
-                    [
-                        pt.tensor(
-                            self._create_vtk_reader(
-                                self._build_file_path(t)).PointData[field_name],
-                            dtype=self._dtype
-                        ) for t in time
-                    ],
-                    dim=-1
+                return self._stack_snapshots(
+                    self._read_snapshots(time), field_name
                 )
             else:
-                return pt.tensor(
-                    self._create_vtk_reader(self._build_file_path(time)).PointData[
-                        field_name], dtype=self._dtype
-                )
+                return self._to_device(self._as_tensor(
+                    self._load_grid(
+                        self._build_file_path(time)).PointData[field_name]
+                ))
 
     @ property
     def write_times(self) -> List[str]:
         if self._write_times is None:
-            files = glob(self._build_file_path("*"))
+            with scandir(self._path) as entries:
+                names = [
+                    entry.name for entry in entries
+                    if entry.is_file()
+                    and entry.name.startswith(self._prefix)
+                    and entry.name.endswith(self._suffix)
+                ]
             self._write_times = sorted(
-                [f.split(sep)[-1][len(self._prefix):-len(self._suffix)]
-                 for f in files], key=float
+                [name.removeprefix(self._prefix).removesuffix(self._suffix)
+                 for name in names], key=float
             )
         return self._write_times
 
     @ property
     def field_names(self) -> Dict[str, List[str]]:
         if self._field_names is None:
-            snapshot = self._create_vtk_reader(
-                self._build_file_path(self.write_times[0])
-            )
             self._field_names = dict(
-                {self.write_times[0]: snapshot.PointData.keys()}
+                {self.write_times[0]: self._first_snapshot().PointData.keys()}
             )
         return self._field_names
 
     @ property
     def vertices(self) -> pt.Tensor:
-        snapshot = self._create_vtk_reader(
-            self._build_file_path(self.write_times[0])
-        )
-        return pt.tensor(snapshot.Points, dtype=self._dtype)
+        return self._to_device(self._as_tensor(self._first_snapshot().Points))
 
     @ property
     def weights(self) -> pt.Tensor: